@@ -1,4 +1,5 @@
 """Code generation utilities"""
+import concurrent.futures
 import imp
 import json
 import os
@@ -14,6 +15,10 @@ from .utils import (SchemaInfo, is_valid_identifier, indent_docstring, indent_ar
                     load_metaschema)
 
 
+# Matches the condition block appended to some descriptions; see docstring()
+_CONDITION_BLOCK = re.compile(r"\n\{\n(\n|.)*\n\}")
+
+
 class CodeSnippet(object):
     """Object whose repr() is a string of code"""
     def __init__(self, code):
@@ -111,6 +116,20 @@ class SchemaClassGenerator(object):
         self.schemarepr = schemarepr
         self.rootschemarepr = rootschemarepr
         self.nodefault = nodefault
+        self._info = None
+        self._args = None
+
+    def _schema_info(self):
+        """The SchemaInfo for the schema, shared by docstring() and init_code()"""
+        if self._info is None:
+            self._info = SchemaInfo(self.schema, rootschema=self.rootschema)
+        return self._info
+
+    def _schema_args(self):
+        """The result of _get_args(), shared by docstring() and init_code()"""
+        if self._args is None:
+            self._args = _get_args(self._schema_info())
+        return self._args
 
     def schema_class(self):
         """Generate code for a schema class"""
@@ -136,16 +155,16 @@ class SchemaClassGenerator(object):
         #       for example, a non-object definition should list valid type, enum
         #       values, etc.
         # TODO: use _get_args here for more information on allOf objects
-        info = SchemaInfo(self.schema, self.rootschema)
+        info = self._schema_info()
         doc = ["{} schema wrapper".format(self.classname),
                '',
                info.medium_description]
         if info.description:
             doc += self._process_description( #remove condition description
-                re.sub(r"\n\{\n(\n|.)*\n\}",'',info.description)).splitlines()
+                _CONDITION_BLOCK.sub('', info.description)).splitlines()
 
         if info.properties:
-            nonkeyword, required, kwds, invalid_kwds, additional = _get_args(info)
+            nonkeyword, required, kwds, invalid_kwds, additional = self._schema_args()
             doc += ['',
                     'Attributes',
                     '----------',
@@ -161,12 +180,11 @@ class SchemaClassGenerator(object):
 
     def init_code(self, indent=0):
         """Return code suitablde for the __init__ function of a Schema class"""
-        info = SchemaInfo(self.schema, rootschema=self.rootschema)
-        nonkeyword, required, kwds, invalid_kwds, additional =_get_args(info)
+        nonkeyword, required, kwds, invalid_kwds, additional = self._schema_args()
 
         nodefault=set(self.nodefault)
-        required -= nodefault
-        kwds -= nodefault
+        required = required - nodefault
+        kwds = kwds - nodefault
 
         args = ['self']
         super_args = []
@@ -197,6 +215,11 @@ class SchemaClassGenerator(object):
         return initfunc
 
 
+def _schema_class_code(gen):
+    """Return gen.schema_class(); defined at module level for worker processes"""
+    return gen.schema_class()
+
+
 class SchemaModuleGenerator(object):
     """Generate a Python module implementing the schema
 
@@ -208,17 +231,26 @@ class SchemaModuleGenerator(object):
         The name of the root class (default: 'Root')
     schemapi_import : string
         The import path for schemapi (default: 'schemapi')
+    parallel : boolean
+        If True, generate the definition classes in a pool of worker
+        processes (default: False). This helps for schemas with many
+        definitions; smaller schemas are always generated serially, as
+        process startup would dominate.
     """
+    # minimum number of definitions for which parallel=True uses a pool
+    _min_parallel_definitions = 8
 
     schema_module_header = textwrap.dedent("""
     # Module generated by SchemaModuleGenerator
 
     from {schemapi} import SchemaBase, Undefined
     """)
-    def __init__(self, schema, root_name='Root', schemapi_import='schemapi'):
+    def __init__(self, schema, root_name='Root', schemapi_import='schemapi',
+                 parallel=False):
         self.schema = schema
         self.root_name = root_name
         self.schemapi_import = schemapi_import
+        self.parallel = parallel
         self._validate()
 
     def _validate(self):
@@ -240,16 +272,28 @@ class SchemaModuleGenerator(object):
         root = SchemaClassGenerator(self.root_name, self.schema,
                                     schemarepr=CodeSnippet(schemarepr))
         code.append(root.schema_class())
-        
+
+        gens = []
         for name, subschema in definitions.items():
             schemarepr = f"{{'$ref': '#/definitions/{name}'}}"
             rootschemarepr = f'{self.root_name}._schema'
-            gen = SchemaClassGenerator(classname=name,
-                                       schema=subschema,
-                                       rootschema=self.schema,
-                                       schemarepr=CodeSnippet(schemarepr),
-                                       rootschemarepr=CodeSnippet(rootschemarepr))
-            code.append(gen.schema_class())
+            gens.append(SchemaClassGenerator(classname=name,
+                                             schema=subschema,
+                                             rootschema=self.schema,
+                                             schemarepr=CodeSnippet(schemarepr),
+                                             rootschemarepr=CodeSnippet(rootschemarepr)))
+
+        if self.parallel and len(gens) >= self._min_parallel_definitions:
+            # Each chunk of generators is pickled as one object, so the shared
+            # root schema is only serialized once per chunk.
+            # the pool starts all its workers up front: don't start idle ones
+            workers = min(os.cpu_count() or 1, len(gens))
+            chunksize = -(-len(gens) // (4 * workers))
+            with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+                code.extend(executor.map(_schema_class_code, gens,
+                                         chunksize=chunksize))
+        else:
+            code.extend(gen.schema_class() for gen in gens)
 
         return '\n\n'.join(code)
 
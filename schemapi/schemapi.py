@@ -2,6 +2,7 @@ import collections
 import contextlib
 import inspect
 import json
+import threading
 
 import jsonschema
 import six
@@ -195,7 +196,7 @@ class SchemaBase(object):
                 and self._args == other._args
                 and self._kwds == other._kwds)
 
-    def to_dict(self, validate=True, ignore=[], context={}):
+    def to_dict(self, validate=True, ignore=None, context=None):
         """Return a dictionary representation of the object
 
         Parameters
@@ -205,7 +206,7 @@ class SchemaBase(object):
             against the schema. If "deep" then recursively validate
             all objects in the spec. This takes much more time, but
             it results in friendlier tracebacks for large objects.
-        ignore : list
+        ignore : list (optional)
             A list of keys to ignore. This will *not* passed to child to_dict
             function calls.
         context : dict (optional)
@@ -222,6 +223,11 @@ class SchemaBase(object):
         jsonschema.ValidationError :
             if validate=True and the dict does not conform to the schema
         """
+        # fresh containers per call: context is shared with all children
+        if ignore is None:
+            ignore = []
+        if context is None:
+            context = {}
         sub_validate = 'deep' if validate == 'deep' else False
 
         def _todict(val):
@@ -250,7 +256,7 @@ class SchemaBase(object):
                 raise SchemaValidationError(self, err)
         return result
 
-    def to_json(self, validate=True, ignore=[], context={},
+    def to_json(self, validate=True, ignore=None, context=None,
                 indent=2, sort_keys=True, **kwargs):
         """Emit the JSON representation for this object as a string.
 
@@ -261,7 +267,7 @@ class SchemaBase(object):
             against the schema. If "deep" then recursively validate
             all objects in the spec. This takes much more time, but
             it results in friendlier tracebacks for large objects.
-        ignore : list
+        ignore : list (optional)
             A list of keys to ignore. This will *not* passed to child to_dict
             function calls.
         context : dict (optional)
@@ -341,6 +347,36 @@ class SchemaBase(object):
         dct = json.loads(json_string, **kwargs)
         return cls.from_dict(dct, validate=validate)
 
+    @classmethod
+    def _get_resolver(cls):
+        """Return a RefResolver for the class's root schema"""
+        return cls._resolver_state().resolver
+
+    @classmethod
+    def _resolver_state(cls):
+        """Return the per-thread reference resolution state for the class
+
+        Building a resolver is relatively costly, and validate() is called
+        for every object instantiation in debug mode, so the resolver (along
+        with its internal caches) is reused. Resolvers track a scope stack
+        while resolving, so each thread gets its own. The state also holds
+        the fully-resolved target of each reference seen so far.
+
+        The state is only rebuilt when the root schema is replaced by a
+        different object: root schemas must not be mutated in place (e.g.
+        by editing their definitions) after the class is first used.
+        """
+        rootschema = cls._rootschema or cls._schema
+        local = cls.__dict__.get('_resolver_local')
+        if local is None:
+            local = threading.local()
+            cls._resolver_local = local
+        resolver = getattr(local, 'resolver', None)
+        if resolver is None or resolver.referrer is not rootschema:
+            local.resolver = jsonschema.RefResolver.from_schema(rootschema)
+            local.resolved_refs = {}
+        return local
+
     @classmethod
     def validate(cls, instance, schema=None):
         """
@@ -349,19 +385,31 @@ class SchemaBase(object):
         """
         if schema is None:
             schema = cls._schema
-        resolver = jsonschema.RefResolver.from_schema(cls._rootschema or cls._schema)
+        resolver = cls._get_resolver()
         return jsonschema.validate(instance, schema, resolver=resolver)
 
     @classmethod
     def resolve_references(cls, schema):
         """Resolve references of the schema the context of this object's schema"""
-        resolver = jsonschema.RefResolver.from_schema(cls._rootschema
-                                                      or cls._schema
-                                                      or schema)
-        while '$ref' in schema:
-            with resolver.resolving(schema['$ref']) as resolved:
-                schema = resolved
-        return schema
+        if not (cls._rootschema or cls._schema):
+            resolver = jsonschema.RefResolver.from_schema(schema)
+            while '$ref' in schema:
+                with resolver.resolving(schema['$ref']) as resolved:
+                    schema = resolved
+            return schema
+
+        if '$ref' not in schema:
+            return schema
+        # Chains of references (Foo -> Bar -> Baz) are followed once, and the
+        # final target is memoized under the first reference of the chain.
+        state = cls._resolver_state()
+        ref = schema['$ref']
+        if ref not in state.resolved_refs:
+            while '$ref' in schema:
+                with state.resolver.resolving(schema['$ref']) as resolved:
+                    schema = resolved
+            state.resolved_refs[ref] = schema
+        return state.resolved_refs[ref]
 
     def __dir__(self):
         return list(self._kwds.keys())
@@ -383,6 +431,12 @@ class _FromDict(object):
         for cls in class_list:
             if cls._schema is not None:
                 self.class_dict[self.hash_schema(cls._schema)].append(cls)
+        # The same subschemas are hashed & resolved over and over while
+        # walking a spec (e.g. once per list item), so the wrapper class
+        # matched by each subschema's hash and its resolved schema are
+        # memoized by identity. The subschema is stored in the value so that
+        # its id stays valid.
+        self._constructor_cache = {}
 
     @classmethod
     def hash_schema(cls, schema, use_json=True):
@@ -433,12 +487,15 @@ class _FromDict(object):
         schema = root.resolve_references(schema)
 
         def _get_constructor(schema):
-            # TODO: do something more than simply selecting the last match?
-            hash_ = self.hash_schema(schema)
-            matches = self.class_dict[hash_]
-            constructor = matches[-1] if matches else self._passthrough
-            schema = root.resolve_references(schema)
-            return constructor, schema
+            key = (root, id(schema))
+            if key not in self._constructor_cache:
+                # TODO: do something more than simply selecting the last match?
+                hash_ = self.hash_schema(schema)
+                matches = self.class_dict[hash_]
+                constructor = matches[-1] if matches else self._passthrough
+                resolved = root.resolve_references(schema)
+                self._constructor_cache[key] = (schema, constructor, resolved)
+            return self._constructor_cache[key][1:]
 
         if 'anyOf' in schema or 'oneOf' in schema:
             schemas = schema.get('anyOf', []) + schema.get('oneOf', [])
@@ -60,4 +60,14 @@ def test_dynamic_module(schema):
     dct = family.to_dict()
     assert dct == {'family_name': 'Smith', 'people': [{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 26}]}
     family2 = Family.from_dict(dct)
-    assert family2.to_dict() == dct
\ No newline at end of file
+    assert family2.to_dict() == dct
+
+
+def test_parallel_module_code(schema):
+    for i in range(10):
+        schema['definitions']['Item{}'.format(i)] = {
+            'properties': {'value': {'$ref': '#/definitions/Person'}}
+        }
+    serial = SchemaModuleGenerator(schema, root_name='Family').module_code()
+    gen = SchemaModuleGenerator(schema, root_name='Family', parallel=True)
+    assert gen.module_code() == serial
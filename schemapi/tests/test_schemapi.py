@@ -293,3 +293,81 @@ def test_schema_validation_error():
     assert 'test_schemapi.MySchema->a' in message
     assert "validating {!r}".format(the_err.validator) in message
     assert the_err.message in message
+
+
+def test_resolver_reused():
+    assert StringMapping._get_resolver() is StringMapping._get_resolver()
+    assert StringMapping._get_resolver() is not StringArray._get_resolver()
+    assert StringMapping._get_resolver().referrer is MySchema._schema
+    assert StringMapping.resolve_references(StringMapping._schema) == \
+        MySchema._schema['definitions']['StringMapping']
+
+
+def test_resolve_reference_chain():
+    class Chained(SchemaBase):
+        _schema = {'$ref': '#/definitions/Chain1'}
+        _rootschema = {
+            'definitions': {
+                'Chain1': {'$ref': '#/definitions/Chain2'},
+                'Chain2': {'$ref': '#/definitions/Chain3'},
+                'Chain3': {'type': 'string'}
+            }
+        }
+    for _ in range(2):
+        assert Chained.resolve_references(Chained._schema) == {'type': 'string'}
+    assert Chained.resolve_references({'$ref': '#/definitions/Chain2'}) == \
+        {'type': 'string'}
+    assert Chained('foo').to_dict() == 'foo'
+
+
+def test_from_dict_resolves_each_subschema_once(monkeypatch):
+    class People(_TestSchema):
+        _schema = {
+            'definitions': {
+                'Person': {'type': 'object',
+                           'properties': {'name': {'type': 'string'},
+                                          'pet': {'$ref': '#/definitions/Pet'}}},
+                'Pet': {'type': 'string', 'enum': ['cat', 'dog']}
+            },
+            'type': 'object',
+            'properties': {
+                'people': {'type': 'array',
+                           'items': {'$ref': '#/definitions/Person'}}
+            }
+        }
+
+    class Person(_TestSchema):
+        _schema = {'$ref': '#/definitions/Person'}
+        _rootschema = People._schema
+
+    hashed = []
+    resolved = []
+    hash_schema = _FromDict.hash_schema.__func__
+    resolve_references = People.resolve_references.__func__
+
+    def counting_hash_schema(cls, schema, use_json=True):
+        hashed.append(id(schema))
+        return hash_schema(cls, schema, use_json)
+
+    def counting_resolve_references(cls, schema):
+        resolved.append(id(schema))
+        return resolve_references(cls, schema)
+
+    monkeypatch.setattr(_FromDict, 'hash_schema',
+                        classmethod(counting_hash_schema))
+    monkeypatch.setattr(People, 'resolve_references',
+                        classmethod(counting_resolve_references))
+
+    dct = {'people': [{'name': 'Alice', 'pet': 'cat'},
+                      {'name': 'Bob', 'pet': 'dog'},
+                      {'name': 'Carol', 'pet': 'cat'}]}
+    people = People.from_dict(dct)
+    assert people.to_dict() == dct
+    assert all(isinstance(p, Person) for p in people.people)
+
+    item_schema = People._schema['properties']['people']['items']
+    person_props = People._schema['definitions']['Person']['properties']
+    for schema in [item_schema, person_props['name'], person_props['pet']]:
+        assert hashed.count(id(schema)) == 1
+    for schema in [item_schema, person_props['pet']]:
+        assert resolved.count(id(schema)) == 1
@@ -1,6 +1,9 @@
+import textwrap
+
 import pytest
 
-from ..utils import get_valid_identifier
+from ..utils import (get_valid_identifier, resolve_references, SchemaInfo,
+                     indent_docstring, indent_arglist)
 from ..schemapi import _FromDict
 
 
@@ -25,9 +28,96 @@ def test_get_valid_identifier():
     assert get_valid_identifier('--') == '_'
 
 
+def test_resolve_references(refschema):
+    assert resolve_references(refschema) == {'type': 'string'}
+    assert resolve_references({'$ref': '#/definitions/Bar'},
+                              refschema) == {'type': 'string'}
+    # JSON pointer & percent escapes
+    root = {'definitions': {'a/b': {'type': 'integer'},
+                            'c d': {'anyOf': [{'type': 'null'}]}}}
+    assert resolve_references({'$ref': '#/definitions/a~1b'},
+                              root) == {'type': 'integer'}
+    assert resolve_references({'$ref': '#/definitions/c%20d/anyOf/0'},
+                              root) == {'type': 'null'}
+
+
 @pytest.mark.parametrize('use_json', [True, False])
 def test_hash_schema(refschema, use_json):
     copy = refschema.copy()
     copy['description'] = "A schema"
     copy['title'] = "Schema to test"
     assert _FromDict.hash_schema(refschema) == _FromDict.hash_schema(copy)
+
+
+def test_schema_info_properties_cached():
+    info = SchemaInfo({'properties': {'a': {'type': 'string'}}})
+    assert info.properties is info.properties
+    assert info.properties['a'] is info.properties.a
+    assert info.properties['a'].medium_description == 'string'
+
+
+def test_schema_info_multiple_types():
+    info = SchemaInfo({'type': ['string', 'number', 'null']})
+    assert info.medium_description == 'anyOf(string, float, None)'
+    assert info.medium_description == 'anyOf(string, float, None)'
+
+    info = SchemaInfo({'type': ['array', 'null'], 'items': {'type': 'string'}})
+    assert info.medium_description == 'anyOf(List(string), None)'
+
+
+@pytest.mark.parametrize('line', [
+    'a' * 22,                    # fits exactly at the width
+    'a' * 23,                    # one long word over the width
+    'word ' * 8,                 # wraps over several lines
+    'foo bar  ',                 # trailing spaces
+    'foo\tbar',                  # tab
+    'foo\x0bbar\x0c',             # other non-printables
+    '* list item',
+    '*   list item with leading spaces',
+    '* ' + 'item ' * 10,         # list item over the width
+    '* ',
+])
+def test_indent_docstring_matches_textwrapper(line):
+    indent_level, width = 4, 30
+    stripped = line.lstrip()
+    if stripped.startswith('* '):
+        wrapper = textwrap.TextWrapper(width=width - indent_level,
+                                       initial_indent=indent_level * ' ' + '* ',
+                                       subsequent_indent=indent_level * ' ' + '  ',
+                                       break_long_words=False,
+                                       break_on_hyphens=False,
+                                       drop_whitespace=True)
+        wrapped = wrapper.wrap(stripped[2:])
+    else:
+        wrapper = textwrap.TextWrapper(width=width - indent_level,
+                                       initial_indent=indent_level * ' ',
+                                       subsequent_indent=indent_level * ' ',
+                                       break_long_words=False,
+                                       break_on_hyphens=False,
+                                       drop_whitespace=True)
+        wrapped = wrapper.wrap(stripped)
+    expected = '\n'.join([l.rstrip() for l in wrapped[:-1]] + wrapped[-1:])
+    result = indent_docstring([line], indent_level=indent_level,
+                              width=width, lstrip=False)
+    assert result == expected
+
+
+@pytest.mark.parametrize('args', [
+    [],
+    ['self', 'a=Undefined', 'bcdefghi=Undefined'],    # exactly fits the width
+    ['self', 'a=Undefined', 'bcdefghij=Undefined'],   # one character over
+    ['self', 'a=Undefined '],                    # trailing space
+    ['self'] + ['arg{}=Undefined'.format(i) for i in range(10)],
+])
+@pytest.mark.parametrize('lstrip', [True, False])
+def test_indent_arglist_matches_textwrapper(args, lstrip):
+    indent_level, width = 8, 45
+    wrapper = textwrap.TextWrapper(width=width,
+                                   initial_indent=indent_level * ' ',
+                                   subsequent_indent=indent_level * ' ',
+                                   break_long_words=False)
+    expected = '\n'.join(wrapper.wrap(', '.join(args)))
+    if lstrip:
+        expected = expected.lstrip()
+    assert indent_arglist(args, indent_level=indent_level, width=width,
+                          lstrip=lstrip) == expected
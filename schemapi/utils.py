@@ -1,28 +1,83 @@
 """Utilities for working with schemas"""
 
+import functools
 import json
 import keyword
 import pkgutil
 import re
 import textwrap
+from urllib.parse import unquote
 
 import jsonschema
 
 
 EXCLUDE_KEYS = ('definitions', 'title', 'description', '$schema', 'id')
 
+SIMPLE_TYPE_DESCRIPTIONS = {'string': 'string',
+                            'number': 'float',
+                            'integer': 'integer',
+                            'object': 'mapping',
+                            'boolean': 'boolean',
+                            'array': 'list',
+                            'null': 'None'}
+
+# Patterns used by get_valid_identifier & is_valid_identifier, compiled once
+# rather than on every call: these are hit once per property during codegen.
+_INVALID_CHARS = {flags: re.compile(r'\W', flags) for flags in (re.ASCII, re.UNICODE)}
+_VALID_IDENTIFIER = {flags: re.compile(r'^[^\d\W]\w*\Z', flags)
+                     for flags in (re.ASCII, re.UNICODE)}
+_LEADING_INVALID = re.compile(r'^[\d\W]')
+
+
+# The bundled metaschema is read once at import rather than on every
+# load_metaschema() call (i.e. every SchemaModuleGenerator validation).
+_METASCHEMA_SRC = pkgutil.get_data(__name__, 'jsonschema-draft04.json').decode('utf-8')
+
 
 def load_metaschema():
-    schema = pkgutil.get_data(__name__, 'jsonschema-draft04.json')
-    schema = schema.decode('utf-8')
-    return json.loads(schema)
+    return json.loads(_METASCHEMA_SRC)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_ref(ref):
+    """Split a local reference like '#/definitions/Foo' into its path parts
+
+    The same handful of reference strings are resolved over and over during
+    code generation, so the parsed & unescaped parts are cached.
+    """
+    if not ref.startswith('#/'):
+        raise ValueError("{!r} is not a local reference".format(ref))
+    return tuple(part.replace('~1', '/').replace('~0', '~')
+                 for part in unquote(ref[2:]).split('/'))
+
+
+def _resolve_local_ref(root, ref):
+    """Resolve a local reference by walking the root schema"""
+    schema = root
+    for part in _parse_ref(ref):
+        # exact type checks are enough (and cheaper) for JSON-parsed schemas
+        if type(schema) is list:
+            part = int(part)
+        schema = schema[part]
+    return schema
 
 
 def resolve_references(schema, root=None):
     """Resolve References within a JSON schema"""
-    resolver = jsonschema.RefResolver.from_schema(root or schema)
+    root = root or schema
+    resolver = None
     while '$ref' in schema:
-        with resolver.resolving(schema['$ref']) as resolved:
+        ref = schema['$ref']
+        # Local references are resolved by walking the root directly; only
+        # remote or unresolvable references need a full RefResolver.
+        try:
+            schema = _resolve_local_ref(root, ref)
+            continue
+        except (ValueError, LookupError, TypeError):
+            pass
+        if resolver is None:
+            resolver = jsonschema.RefResolver.from_schema(root)
+        with resolver.resolving(ref) as resolved:
             schema = resolved
     return schema
 
@@ -53,7 +108,7 @@ def get_valid_identifier(prop, replacement_character='', allow_unicode=False):
     """
     # First substitute-out all non-valid characters.
     flags = re.UNICODE if allow_unicode else re.ASCII
-    valid = re.sub('\W', replacement_character, prop, flags=flags)
+    valid = _INVALID_CHARS[flags].sub(replacement_character, prop)
 
     # If nothing is left, use just an underscore
     if not valid:
@@ -61,7 +116,7 @@ def get_valid_identifier(prop, replacement_character='', allow_unicode=False):
 
     # first character must be a non-digit. Prefix with an underscore
     # if needed
-    if re.match('^[\d\W]', valid):
+    if _LEADING_INVALID.match(valid):
         valid = '_' + valid
 
     # if the result is a reserved keyword, then add an underscore at the end
@@ -81,16 +136,20 @@ def is_valid_identifier(var, allow_unicode=False):
         if True, then allow Python 3 style unicode identifiers.
     """
     flags = re.UNICODE if allow_unicode else re.ASCII
-    is_valid = re.match("^[^\d\W]\w*\Z", var, flags)
+    is_valid = _VALID_IDENTIFIER[flags].match(var)
     return is_valid and not keyword.iskeyword(var)
 
 
 class SchemaProperties(object):
     """A wrapper for properties within a schema"""
+    __slots__ = ('_properties', '_schema', '_rootschema', '_wrapped')
+
     def __init__(self, properties, schema, rootschema=None):
         self._properties = properties
         self._schema = schema
         self._rootschema = rootschema or schema
+        # wrapped children are built on first access; schemas are not mutated
+        self._wrapped = {}
 
     def __bool__(self):
         return bool(self._properties)
@@ -99,16 +158,22 @@ class SchemaProperties(object):
         return list(self._properties.keys())
 
     def __getattr__(self, attr):
+        # only called after normal lookup fails, so a miss is a plain error
         try:
             return self[attr]
         except KeyError:
-            return super().__getattr__(attr)
+            raise AttributeError(attr)
 
     def __getitem__(self, attr):
+        try:
+            return self._wrapped[attr]
+        except KeyError:
+            pass
         dct = self._properties[attr]
         if 'definitions' in self._schema and 'definitions' not in dct:
             dct = dict(definitions=self._schema['definitions'], **dct)
-        return SchemaInfo(dct, self._rootschema)
+        info = self._wrapped[attr] = SchemaInfo(dct, self._rootschema)
+        return info
 
     def __iter__(self):
         return iter(self._properties)
@@ -125,6 +190,11 @@ class SchemaProperties(object):
 
 class SchemaInfo(object):
     """A wrapper for inspecting a JSON schema"""
+    # one instance is created per node of the schema tree, so avoid a
+    # per-instance __dict__. Subclasses may add their own __slots__.
+    __slots__ = ('raw_schema', 'rootschema', 'schema', '_properties',
+                 '_definitions', '_medium_description')
+
     def __init__(self, schema, rootschema=None, validate=False):
         if hasattr(schema, '_schema'):
             if hasattr(schema, '_rootschema'):
@@ -140,6 +210,9 @@ class SchemaInfo(object):
         self.raw_schema = schema
         self.rootschema = rootschema
         self.schema = resolve_references(schema, rootschema)
+        self._properties = None
+        self._definitions = None
+        self._medium_description = None
 
     def child(self, schema):
         return self.__class__(schema, rootschema=self.rootschema)
@@ -175,13 +248,13 @@ class SchemaInfo(object):
 
     @property
     def medium_description(self):
-        _simple_types = {'string': 'string',
-                         'number': 'float',
-                         'integer': 'integer',
-                         'object': 'mapping',
-                         'boolean': 'boolean',
-                         'array': 'list',
-                         'null': 'None'}
+        # computed once per node: children cache their own descriptions, so
+        # each subtree is only walked once however often it is described.
+        if self._medium_description is None:
+            self._medium_description = self._get_medium_description()
+        return self._medium_description
+
+    def _get_medium_description(self):
         if self.is_empty():
             return 'any object'
         elif self.is_enum():
@@ -197,20 +270,25 @@ class SchemaInfo(object):
                                                  for s in self.allOf))
         elif self.is_not():
             return 'not {}'.format(self.not_.short_description)
-        elif isinstance(self.type, list):
+        type_ = self.type
+        if type(type_) is list:  # JSON-parsed: never a list subclass
             options = []
-            subschema = SchemaInfo(dict(**self.schema))
-            for typ_ in self.type:
-                subschema.schema['type'] = typ_
-                options.append(subschema.short_description)
+            for typ_ in type_:
+                # only object & array descriptions depend on the rest of the
+                # schema; primitive types need no child wrapper.
+                if typ_ in SIMPLE_TYPE_DESCRIPTIONS and typ_ not in ('object', 'array'):
+                    options.append(SIMPLE_TYPE_DESCRIPTIONS[typ_])
+                else:
+                    subschema = SchemaInfo(dict(self.schema, type=typ_))
+                    options.append(subschema.short_description)
             return "anyOf({})".format(', '.join(options))
         elif self.is_object():
             return "Mapping(required=[{}])".format(', '.join(self.required))
-        elif self.is_array():
+        elif type_ == 'array':
             return "List({})".format(self.child(self.items).short_description)
-        elif self.type in _simple_types:
-            return _simple_types[self.type]
-        elif not self.type:
+        elif type_ in SIMPLE_TYPE_DESCRIPTIONS:
+            return SIMPLE_TYPE_DESCRIPTIONS[type_]
+        elif not type_:
             import warnings
             warnings.warn("no short_description for schema\n{}"
                           "".format(self.schema))
@@ -223,13 +301,17 @@ class SchemaInfo(object):
 
     @property
     def properties(self):
-        return SchemaProperties(self.schema.get('properties', {}),
-                                self.schema, self.rootschema)
+        if self._properties is None:
+            self._properties = SchemaProperties(self.schema.get('properties', {}),
+                                                self.schema, self.rootschema)
+        return self._properties
 
     @property
     def definitions(self):
-        return SchemaProperties(self.schema.get('definitions', {}),
-                                self.schema, self.rootschema)
+        if self._definitions is None:
+            self._definitions = SchemaProperties(self.schema.get('definitions', {}),
+                                                 self.schema, self.rootschema)
+        return self._definitions
 
     @property
     def required(self):
@@ -309,11 +391,15 @@ class SchemaInfo(object):
         return 'not' in self.schema
 
     def is_object(self):
-        if self.type == 'object':
+        schema = self.schema
+        type_ = schema.get('type', None)
+        if type_ == 'object':
             return True
-        elif self.type is not None:
+        elif type_ is not None:
             return False
-        elif self.properties or self.required or self.patternProperties or self.additionalProperties:
+        elif (schema.get('properties') or schema.get('required')
+              or schema.get('patternProperties')
+              or schema.get('additionalProperties', True)):
             return True
         else:
             raise ValueError("Unclear whether schema.is_object() is True")
@@ -351,46 +437,77 @@ class SchemaInfo(object):
         return {prop: val for prop, val in pairs if prop != val}
 
 
+def _fits_on_line(text, indent, width):
+    """True if a TextWrapper would emit the indented text unchanged"""
+    return (text.isprintable() and not text.endswith(' ')
+            and len(indent) + len(text) <= width)
+
+
 def indent_arglist(args, indent_level, width=100, lstrip=True):
     """Indent an argument list for use in generated code"""
-    wrapper = textwrap.TextWrapper(width=width,
-                                   initial_indent=indent_level * ' ',
-                                   subsequent_indent=indent_level * ' ',
-                                   break_long_words=False)
-    wrapped = '\n'.join(wrapper.wrap(', '.join(args)))
+    indent = indent_level * ' '
+    arglist = ', '.join(args)
+    # most argument lists are empty or fit on one line: no wrapping needed
+    if not arglist:
+        wrapped = ''
+    elif _fits_on_line(arglist, indent, width):
+        wrapped = indent + arglist
+    else:
+        wrapper = textwrap.TextWrapper(width=width,
+                                       initial_indent=indent,
+                                       subsequent_indent=indent,
+                                       break_long_words=False)
+        wrapped = '\n'.join(wrapper.wrap(arglist))
     if lstrip:
         wrapped = wrapped.lstrip()
     return wrapped
 
 
+def _wrap(wrapper, text):
+    """Equivalent to wrapper.wrap(text), skipping the wrapper for short text
+
+    Most docstring lines fit within the width unchanged; for printable text
+    without trailing spaces the wrapped result is then the text itself.
+    """
+    if text and _fits_on_line(text, wrapper.initial_indent, wrapper.width):
+        return [wrapper.initial_indent + text]
+    return wrapper.wrap(text)
+
+
 def indent_docstring(lines, indent_level, width=100, lstrip=True):
     """Indent a docstring for use in generated code"""
     final_lines = []
+    # wrappers only depend on the indentation, so build them once per indent
+    # rather than once per line.
+    wrappers = {}
 
     for i, line in enumerate(lines):
         stripped = line.lstrip()
         if stripped:
             leading_space = len(line) - len(stripped)
             indent = indent_level + leading_space
-            wrapper = textwrap.TextWrapper(width=width - indent,
-                                            initial_indent= indent * ' ',
-                                            subsequent_indent=indent * ' ',
-                                            break_long_words=False,
-                                            break_on_hyphens=False,
-                                            drop_whitespace=True)
-            list_wrapper = textwrap.TextWrapper(width=width - indent,
-                                                initial_indent= indent * ' '+'* ',
-                                                subsequent_indent=indent * ' '+ '  ',
-                                                break_long_words=False,
-                                                break_on_hyphens=False,
-                                                drop_whitespace=True)
+            if indent not in wrappers:
+                wrappers[indent] = (
+                    textwrap.TextWrapper(width=width - indent,
+                                         initial_indent= indent * ' ',
+                                         subsequent_indent=indent * ' ',
+                                         break_long_words=False,
+                                         break_on_hyphens=False,
+                                         drop_whitespace=True),
+                    textwrap.TextWrapper(width=width - indent,
+                                         initial_indent= indent * ' '+'* ',
+                                         subsequent_indent=indent * ' '+ '  ',
+                                         break_long_words=False,
+                                         break_on_hyphens=False,
+                                         drop_whitespace=True))
+            wrapper, list_wrapper = wrappers[indent]
             for line in stripped.split("\n"):
                 if line == '':
                     final_lines.append('')
                 elif line.startswith('* '):
-                    final_lines.extend(list_wrapper.wrap(line[2:]))
+                    final_lines.extend(_wrap(list_wrapper, line[2:]))
                 else: 
-                    final_lines.extend(wrapper.wrap(line.lstrip()))
+                    final_lines.extend(_wrap(wrapper, line.lstrip()))
 
         # If this is the last line, put in an indent
         elif i + 1 == len(lines):